@@ -2,6 +2,7 @@
 """Drawing Component for Annotated Scatter."""
 from collections import defaultdict
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Protocol
 
 from matplotlib.font_manager import FontProperties
@@ -78,6 +79,11 @@ class AnnotatedScatterAll:
     scatters: dict[ScatterPointCategory, AnnotatedScatter]
     background_bounds: GpxBounds
 
+    # Text allocation only depends on the paper size (the layout bounds per paper are fixed for a
+    # given track), so memoize it to make toggling back to an already-seen paper size free
+    _scatters_per_paper: dict[str, dict[ScatterPointCategory, AnnotatedScatter]] = field(default_factory=dict,
+                                                                                         init=False, repr=False)
+
     @staticmethod
     def from_scatter(paper_size: PaperSize,
                      background_bounds: GpxBounds,
@@ -89,16 +95,24 @@ class AnnotatedScatterAll:
         input = setup_text_allocation(paper_size, points, params)
         output = allocate_text(input, paper_size, background_bounds, mid_bounds)
         scatters = finalize_text_allocation(paper_size, points, input, output)
-        return AnnotatedScatterAll(scatters, background_bounds)
+        res = AnnotatedScatterAll(scatters, background_bounds)
+        res._scatters_per_paper[paper_size.name] = scatters
+        return res
 
     def change_papersize(self, paper: PaperSize, bounds: GpxBounds, params: AnnotatedScatterAllParamsProtocol) -> None:
         """Change Paper Size and GPX Bounds."""
+        cached_scatters = self._scatters_per_paper.get(paper.name)
+        if cached_scatters is not None:
+            self.scatters = cached_scatters
+            return
+
         # Unlike other components, we need the parameters to change the paper size, since we reallocate the text
         points = [ScatterPoint(name=None if annot is None else annot.text_s, lat=lat, lon=lon, category=category)
                   for category, scatter in self.scatters.items()
                   for lat, lon, annot in zip(scatter.list_lat, scatter.list_lon, scatter.annotations)]
         self.scatters = AnnotatedScatterAll.from_scatter(paper, self.background_bounds, bounds,
                                                          points, params).scatters
+        self._scatters_per_paper[paper.name] = self.scatters
 
     def draw(self, fig: DrawingFigure, params: AnnotatedScatterAllParamsProtocol) -> None:
         """Draw the Scatter points with annotations."""
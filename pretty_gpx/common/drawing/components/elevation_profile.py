@@ -83,10 +83,10 @@ class ElevationProfile:
                    ele_ratio: float,
                    n_points: int = 1000) -> 'ElevationProfile':
         """Initialize the Elevation Profile from a GPX Track and a list of Scatter Points."""
-        # Draw Elevation Over Distance
-        normalized_poly_lon = np.array(track.list_cumul_dist_km)/track.list_cumul_dist_km[-1]  # in [0, 1]
-        min_ele, max_ele = min(track.list_ele_m), max(track.list_ele_m)
-        normalized_poly_lat = (np.array(track.list_ele_m) - min_ele) / (max_ele - min_ele)  # in [0, 1]
+        # Draw Elevation Over Distance (the track buffers are ndarrays, keep them as such end-to-end)
+        normalized_poly_lon = track.list_cumul_dist_km/track.list_cumul_dist_km[-1]  # in [0, 1]
+        min_ele, max_ele = track.list_ele_m.min(), track.list_ele_m.max()
+        normalized_poly_lat = (track.list_ele_m - min_ele) / (max_ele - min_ele)  # in [0, 1]
 
         rel_poly_lat = (1.0-ele_ratio) + ele_ratio * normalized_poly_lat
         rel_poly_lon = normalized_poly_lon
@@ -1,31 +1,41 @@
 #!/usr/bin/python3
 """Light/Dark Color Theme."""
+import functools
 from enum import auto
 from enum import Enum
 from typing import Final
 from typing import Self
+from typing import TypeVar
 
 from matplotlib import colors
 
+T = TypeVar('T', bound='_BaseTheme')
+
 
 class _BaseTheme(Enum):
     """Base Color Theme."""
 
     @classmethod
     def get_mapping(cls) -> dict[str, Self]:
-        """Return the mapping."""
-        color_emojis: Final[dict[str, str]] = {
-            "BLACK": "⬛",
-            "RED": "🟥",
-            "GREEN": "🟩",
-            "YELLOW": "🟨",
-            "BLUE": "🟦",
-            "PURPLE": "🟪",
-            "WHITE": "⬜"
-        }
-        return {''.join(color_emojis[color]
-                        for color in x.name.split('_')): x
-                for x in cls}
+        """Return the mapping (cached, it is rebuilt on every dark-mode toggle otherwise)."""
+        return _get_mapping(cls)
+
+
+@functools.lru_cache
+def _get_mapping(cls: type[T]) -> dict[str, T]:
+    """Build the emoji-to-theme mapping of a theme enum."""
+    color_emojis: Final[dict[str, str]] = {
+        "BLACK": "⬛",
+        "RED": "🟥",
+        "GREEN": "🟩",
+        "YELLOW": "🟨",
+        "BLUE": "🟦",
+        "PURPLE": "🟪",
+        "WHITE": "⬜"
+    }
+    return {''.join(color_emojis[color]
+                    for color in x.name.split('_')): x
+            for x in cls}
 
 
 class DarkTheme(_BaseTheme):
@@ -44,6 +54,7 @@ class LightTheme(_BaseTheme):
     YELLOW_RED_BLACK = auto()
 
 
+@functools.lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> tuple[int, ...]:
     """Convert hexadecimal color string to RGB triplet."""
     rgb_tuple = colors.hex2color(hex_color)
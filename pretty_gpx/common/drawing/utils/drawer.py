@@ -2,6 +2,7 @@
 """Parent class for poster drawers."""
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -11,6 +12,8 @@ from pretty_gpx.common.layout.paper_size import PaperSize
 
 class DrawerBase(ABC):
     """Base Drawer class for posters."""
+    params: Any  # Drawing parameters of the rendering mode (e.g. CityParams, MountainParams)
+
     @abstractmethod
     def change_papersize(self, paper: PaperSize) -> None:
         """Change Papersize of the poster."""
@@ -1,12 +1,15 @@
 #!/usr/bin/python3
 """GPX Bounds."""
+import math
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
 
 from pretty_gpx.common.gpx.gpx_distance import get_delta_xy
 from pretty_gpx.common.gpx.gpx_distance import latlon_aspect_ratio
+from pretty_gpx.common.utils.utils import EARTH_RADIUS_M
 
 
 @dataclass
@@ -30,7 +33,7 @@ class GpxBounds:
                          lat_max=max([b.lat_max for b in list_bounds]))
 
     @staticmethod
-    def from_list(*, list_lon: list[float], list_lat: list[float]) -> 'GpxBounds':
+    def from_list(*, list_lon: list[float] | np.ndarray, list_lat: list[float] | np.ndarray) -> 'GpxBounds':
         """Init GpxBounds from list of latitudes and longitudes."""
         return GpxBounds(lon_min=np.min(list_lon),
                          lon_max=np.max(list_lon),
@@ -52,6 +55,19 @@ class GpxBounds:
                                      dlon=self.dlon*(1. + rel_margin),
                                      dlat=self.dlat*(1. + rel_margin))
 
+    def snap_to_grid(self, grid_m: float = 500.) -> 'GpxBounds':
+        """Expand the bounds outward to a fixed angular grid of roughly `grid_m` meters.
+
+        Nearby views snap to the same bounds, which keeps cache keys stable and lets
+        small pans or zooms reuse previously downloaded data.
+        """
+        step_deg = np.rad2deg(grid_m/EARTH_RADIUS_M)
+        eps = 1.e-6  # Tolerance on the grid index, so that already-snapped bounds stay unchanged
+        return GpxBounds(lon_min=float(np.floor(self.lon_min/step_deg + eps)*step_deg),
+                         lon_max=float(np.ceil(self.lon_max/step_deg - eps)*step_deg),
+                         lat_min=float(np.floor(self.lat_min/step_deg + eps)*step_deg),
+                         lat_max=float(np.ceil(self.lat_max/step_deg - eps)*step_deg))
+
     def is_in_bounds(self, lon: float, lat: float) -> bool:
         """Returns if a point is in the bounds or not."""
         return self.lat_min < lat and lat < self.lat_max and self.lon_min < lon and lon < self.lon_max
@@ -94,7 +110,7 @@ class GpxBounds:
         dx, dy = self.dx_dy_m
         return dx * dy
 
-    @property
+    @cached_property
     def diagonal_m(self) -> float:
-        """The diagonal of the bounds in meters."""
-        return float(np.linalg.norm(self.dx_dy_m))
+        """The diagonal of the bounds in meters (cached, since bounds are never mutated in place)."""
+        return math.hypot(*self.dx_dy_m)
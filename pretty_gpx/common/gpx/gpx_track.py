@@ -1,53 +1,75 @@
 #!/usr/bin/python3
 """Gpx Track."""
+import math
 from dataclasses import dataclass
 from dataclasses import field
+from typing import cast
 
 import matplotlib.pyplot as plt
 import numpy as np
+import shapely
+from gpxpy.geo import EARTH_RADIUS
+from gpxpy.geo import ONE_DEGREE
 from gpxpy.gpx import GPXTrackPoint
-from shapely.geometry import LineString
-from shapely.geometry import Point as ShapelyPoint
 
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
-from pretty_gpx.common.gpx.gpx_distance import get_distance_m
 from pretty_gpx.common.gpx.gpx_distance import latlon_aspect_ratio
 from pretty_gpx.common.gpx.gpx_distance import LocalProjectionXY
 from pretty_gpx.common.gpx.gpx_io import load_gpxpy
 from pretty_gpx.common.utils.asserts import assert_close
 from pretty_gpx.common.utils.asserts import assert_same_len
 from pretty_gpx.common.utils.logger import logger
-from pretty_gpx.common.utils.utils import safe
+from pretty_gpx.common.utils.utils import EARTH_RADIUS_M
 
 DEBUG_TRACK = False
 
+# Broadcast size (n_targets * n_segments) above which an STR-packed R-tree over the polyline segments
+# beats the dense O(N*M) point-to-segment computation
+SEGMENT_TREE_MIN_WORKLOAD = 10_000_000
+
 
 @dataclass
 class GpxTrack:
-    """GPX Track."""
-    list_lon: list[float] = field(default_factory=list)
-    list_lat: list[float] = field(default_factory=list)
-    list_ele_m: list[float] = field(default_factory=list)
-    list_cumul_dist_km: list[float] = field(default_factory=list)
+    """GPX Track.
+
+    Coordinates are stored as Structure-of-Arrays float64 numpy buffers, so that downstream numeric
+    consumers can use them directly without any list-to-array conversion.
+    """
+    list_lon: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    list_lat: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    list_ele_m: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    list_cumul_dist_km: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
 
     uphill_m: float = 0.0
     duration_s: float | None = None
 
+    # Lazy caches for repeated distance queries (see get_distances_m): local XY projection of the track
+    # and R-tree over the projected polyline segments. Invalidated by append_track_to_gpx_track
+    _projected_track: tuple[LocalProjectionXY, np.ndarray] | None = field(default=None, init=False, repr=False)
+    _segments_tree: shapely.STRtree | None = field(default=None, init=False, repr=False)
+    _bounds: GpxBounds | None = field(default=None, init=False, repr=False)
+
     def __post_init__(self) -> None:
+        self.list_lon = np.asarray(self.list_lon, dtype=np.float64)
+        self.list_lat = np.asarray(self.list_lat, dtype=np.float64)
+        self.list_ele_m = np.asarray(self.list_ele_m, dtype=np.float64)
+        self.list_cumul_dist_km = np.asarray(self.list_cumul_dist_km, dtype=np.float64)
         assert_same_len((self.list_lon, self.list_lat, self.list_ele_m, self.list_cumul_dist_km))
 
     def __len__(self) -> int:
-        return len(self.list_lon)
+        return self.list_lon.size
 
     @property
     def dist_km(self) -> float:
         """Get total distance in km."""
-        return self.list_cumul_dist_km[-1]
+        return float(self.list_cumul_dist_km[-1])
 
     def get_bounds(self) -> GpxBounds:
-        """Get the bounds of the track."""
-        return GpxBounds.from_list(list_lon=self.list_lon,
-                                   list_lat=self.list_lat)
+        """Get the bounds of the track (cached, the pipeline asks for them repeatedly)."""
+        if self._bounds is None:
+            self._bounds = GpxBounds.from_list(list_lon=self.list_lon,
+                                               list_lat=self.list_lat)
+        return self._bounds
 
     @staticmethod
     def load(gpx_path: str | bytes) -> 'GpxTrack':
@@ -59,7 +81,7 @@ class GpxTrack:
             for segment in track.segments:
                 append_track_to_gpx_track(gpx_track, segment.points)
 
-        if len(gpx_track.list_lon) == 0:
+        if gpx_track.list_lon.size == 0:
             raise ValueError("No track found in GPX file (or elevation is missing)")
 
         if DEBUG_TRACK:
@@ -78,7 +100,7 @@ class GpxTrack:
 
         gpx_track.duration_s = gpx.get_duration()
 
-        logger.info(f"Loaded GPX track with {len(gpx_track.list_lon)} points: "
+        logger.info(f"Loaded GPX track with {len(gpx_track)} points: "
                     + f"Distance={gpx_track.list_cumul_dist_km[-1]:.1f}km, "
                     + f"Uphill={gpx_track.uphill_m:.0f}m "
                     + "and "
@@ -88,9 +110,12 @@ class GpxTrack:
 
     def is_closed(self, ths_m: float) -> bool:
         """Estimate if the track is closed."""
-        distance_m = get_distance_m(lonlat_1=(self.list_lon[0], self.list_lat[0]),
-                                    lonlat_2=(self.list_lon[-1], self.list_lat[-1]))
-        return distance_m < ths_m
+        # Only the sign of (distance - ths_m) matters: compare squared XY distances to skip the sqrt
+        # (same local projection as get_distance_m)
+        dx_m = EARTH_RADIUS_M*math.radians(float(self.list_lon[0]) - float(self.list_lon[-1])) \
+            * math.cos(math.radians(float(self.list_lat[0])))
+        dy_m = EARTH_RADIUS_M*math.radians(float(self.list_lat[0]) - float(self.list_lat[-1]))
+        return dx_m*dx_m + dy_m*dy_m < ths_m*ths_m
 
     def plot(self, style: str = ".:") -> None:
         """Plot the track."""
@@ -99,23 +124,73 @@ class GpxTrack:
         plt.ylabel('Latitude (in °)')
         plt.gca().set_aspect(latlon_aspect_ratio(lat=self.list_lat[0]))
 
-    def get_distances_m(self, *, targets_lon_lat: list[tuple[float, float]]) -> list[float]:
-        """Get the distances in meters between the track and a list of lon/lat points."""
-        # N.B. Since the GpxTrack might be sparse, espcially along linear segments, it's more accurate to convert it
-        # to a Shapely LineString and compute the distances to the points using Shapely.
-        gpx_lonlat = np.stack([self.list_lon, self.list_lat], axis=-1)
-        local_xy = LocalProjectionXY.fit(lon_lat=gpx_lonlat)
-
-        gpx_xy = local_xy.transform(lon_lat=gpx_lonlat)
-        targets_xy = local_xy.transform(lon_lat=np.array(targets_lon_lat, dtype=float))
-
-        gpx_xy_shapely = LineString(gpx_xy)
-
-        return [ShapelyPoint(target).distance(gpx_xy_shapely) for target in targets_xy]
+    def get_distances_m(self, *, targets_lon_lat: list[tuple[float, float]] | np.ndarray,
+                        max_distance_m: float | None = None) -> list[float]:
+        """Get the distances in meters between the track and a list of lon/lat points.
+
+        If max_distance_m is given, targets whose distance is guaranteed to exceed it are pruned with a cheap
+        bounding-box test and reported as np.inf, skipping the full point-to-segment computation.
+        """
+        # N.B. Since the GpxTrack might be sparse, espcially along linear segments, it's more accurate to compute
+        # the distances to the polyline segments and not only to the track points.
+        local_xy, gpx_xy = self._get_projected_track()
+        targets_xy = local_xy.transform(lon_lat=np.asarray(targets_lon_lat, dtype=float))  # No copy for float64 arrays
+
+        if max_distance_m is not None:
+            # Axis-aligned bounding-box lower bound on the distance (JTS-style envelope short-circuit)
+            outside_xy = np.maximum(gpx_xy.min(axis=0) - targets_xy, 0.0) \
+                + np.maximum(targets_xy - gpx_xy.max(axis=0), 0.0)  # (M, 2)
+            keep = np.hypot(outside_xy[:, 0], outside_xy[:, 1]) <= max_distance_m  # (M,)
+
+            distances_m = np.full(len(targets_xy), np.inf)
+            if keep.any():
+                distances_m[keep] = self.__compute_distances_m(targets_xy=targets_xy[keep], gpx_xy=gpx_xy)
+            return cast(list[float], distances_m.tolist())
+
+        return cast(list[float], self.__compute_distances_m(targets_xy=targets_xy, gpx_xy=gpx_xy).tolist())
+
+    def _get_projected_track(self) -> tuple[LocalProjectionXY, np.ndarray]:
+        """Lazily fit and cache the local XY projection of the track."""
+        if self._projected_track is None:
+            gpx_lonlat = np.stack([self.list_lon, self.list_lat], axis=-1)
+            local_xy = LocalProjectionXY.fit(lon_lat=gpx_lonlat)
+            self._projected_track = (local_xy, local_xy.transform(lon_lat=gpx_lonlat))
+        return self._projected_track
+
+    def __compute_distances_m(self, *, targets_xy: np.ndarray, gpx_xy: np.ndarray) -> np.ndarray:
+        """Point-to-polyline distances in the local XY plane, deduplicating repeated targets."""
+        # POI lists often repeat coordinates (e.g. huts visited twice on multi-day trips): quantize to a
+        # ~1cm grid, solve unique targets only and scatter the results back
+        _, first_idx, inverse = np.unique(np.round(targets_xy, 2), axis=0, return_index=True, return_inverse=True)
+        if len(first_idx) < len(targets_xy):
+            return self.__compute_unique_distances_m(targets_xy=targets_xy[first_idx], gpx_xy=gpx_xy)[inverse]
+        return self.__compute_unique_distances_m(targets_xy=targets_xy, gpx_xy=gpx_xy)
+
+    def __compute_unique_distances_m(self, *, targets_xy: np.ndarray, gpx_xy: np.ndarray) -> np.ndarray:
+        """Point-to-polyline distances in the local XY plane, picking the dense or R-tree path."""
+        if len(targets_xy)*(len(self)-1) < SEGMENT_TREE_MIN_WORKLOAD:
+            return _points_to_polyline_dist_m(targets_xy=targets_xy, gpx_xy=gpx_xy)
+
+        # Large workloads: query the nearest segment in O(log N) per target, then compute the exact
+        # distance to that single segment
+        if self._segments_tree is None:
+            segments = shapely.linestrings(np.stack([gpx_xy[:-1], gpx_xy[1:]], axis=1))
+            self._segments_tree = shapely.STRtree(segments)
+        nearest_idx = self._segments_tree.nearest(shapely.points(targets_xy))
+
+        seg_start = gpx_xy[nearest_idx]  # (M, 2)
+        seg_dir = gpx_xy[nearest_idx+1] - seg_start  # (M, 2)
+        seg_sq_norm = np.sum(seg_dir**2, axis=-1)  # (M,)
+        seg_sq_norm[seg_sq_norm == 0.0] = 1.0
+        t = np.clip(np.sum((targets_xy - seg_start)*seg_dir, axis=-1)/seg_sq_norm, 0.0, 1.0)  # (M,)
+        return np.linalg.norm(targets_xy - (seg_start + t[:, None]*seg_dir), axis=-1)  # (M,)
 
     def get_overpass_lonlat_str(self) -> str:
         """Get the concatenation of points in text to send it to overpass."""
-        return ','.join(f"{lat:.5f},{lon:.5f}" for lat, lon in zip(self.list_lat, self.list_lon))
+        # Vectorized formatting: a single C-level pass instead of one f-string dispatch per point
+        lat_str = np.char.mod('%.5f', self.list_lat)
+        lon_str = np.char.mod('%.5f', self.list_lon)
+        return ','.join(np.char.add(np.char.add(lat_str, ','), lon_str))
 
 
 def append_track_to_gpx_track(gpx_track: GpxTrack, track_points: list[GPXTrackPoint]) -> None:
@@ -127,27 +202,92 @@ def append_track_to_gpx_track(gpx_track: GpxTrack, track_points: list[GPXTrackPo
         gpx_track: GpxTrack to update
         track_points: List of GPXTrackPoint to append (segment.points)
     """
-    has_started = len(gpx_track.list_lon) > 0
+    has_started = gpx_track.list_lon.size > 0
 
     if has_started:
-        prev_cumul_dist_km = gpx_track.list_cumul_dist_km[-1]
+        prev_cumul_dist_km = float(gpx_track.list_cumul_dist_km[-1])
+        points = track_points
     else:
         prev_cumul_dist_km = 0.0
-
-    prev_point: GPXTrackPoint | None = None
-    for point in track_points:
-        if point.elevation is None:
-            if not has_started:
-                continue  # Skip first point if no elevation
-            point.elevation = gpx_track.list_ele_m[-1]
-
-        gpx_track.list_lon.append(point.longitude)
-        gpx_track.list_lat.append(point.latitude)
-        gpx_track.list_ele_m.append(point.elevation)
-
-        if prev_point is not None:
-            prev_cumul_dist_km += safe(prev_point.distance_3d(point)) * 1e-3
-
-        gpx_track.list_cumul_dist_km.append(prev_cumul_dist_km)
-
-        prev_point = point
+        points = [point for point in track_points if point.elevation is not None]  # Skip points without elevation
+
+    n = len(points)
+    if n == 0:
+        return
+
+    # Preallocate and fill the three buffers in a single pass over the gpxpy points
+    lon = np.empty(n, dtype=np.float64)
+    lat = np.empty(n, dtype=np.float64)
+    ele_m = np.empty(n, dtype=np.float64)
+    for i, point in enumerate(points):
+        lon[i] = point.longitude
+        lat[i] = point.latitude
+        ele_m[i] = np.nan if point.elevation is None else point.elevation
+
+    if np.isnan(ele_m).any():
+        # Forward-fill missing elevations, seeded by the last elevation stored in the track
+        ele_m = np.concatenate(([gpx_track.list_ele_m[-1]], ele_m))
+        valid_idx = np.where(np.isfinite(ele_m), np.arange(ele_m.size), 0)
+        np.maximum.accumulate(valid_idx, out=valid_idx)
+        ele_m = ele_m[valid_idx][1:]
+
+        # Keep the gpxpy points in sync, since `load` checks the result against gpx.length_3d()
+        for point, fill_ele_m in zip(points, ele_m):
+            if point.elevation is None:
+                point.elevation = float(fill_ele_m)
+
+    cumul_dist_km = _cumulative_dist_3d_km(lon=lon, lat=lat, ele_m=ele_m, prev_cumul_dist_km=prev_cumul_dist_km)
+
+    gpx_track.list_lon = np.concatenate([gpx_track.list_lon, lon])
+    gpx_track.list_lat = np.concatenate([gpx_track.list_lat, lat])
+    gpx_track.list_ele_m = np.concatenate([gpx_track.list_ele_m, ele_m])
+    gpx_track.list_cumul_dist_km = np.concatenate([gpx_track.list_cumul_dist_km, cumul_dist_km])
+    gpx_track._projected_track = None  # The lazy projection/R-tree/bounds caches no longer match the track
+    gpx_track._segments_tree = None
+    gpx_track._bounds = None
+
+
+def _points_to_polyline_dist_m(*, targets_xy: np.ndarray, gpx_xy: np.ndarray) -> np.ndarray:
+    """Vectorized point-to-segment distances, broadcast across all targets and all polyline segments.
+
+    Targets are processed in blocks so the (block, N, 2) intermediates stay cache-resident and the peak
+    memory is bounded regardless of the number of targets.
+    """
+    seg_start = gpx_xy[:-1]  # (N, 2)
+    seg_dir = gpx_xy[1:] - seg_start  # (N, 2)
+    seg_sq_norm = np.sum(seg_dir**2, axis=-1)  # (N,)
+    seg_sq_norm[seg_sq_norm == 0.0] = 1.0  # Duplicated points: project onto the segment start
+
+    n_targets = len(targets_xy)
+    block = max(1, 4_000_000 // max(1, len(seg_start)))
+    distances_m = np.empty(n_targets)
+    for i0 in range(0, n_targets, block):
+        sub_xy = targets_xy[i0:i0+block]  # (B, 2)
+        rel_targets = sub_xy[:, None, :] - seg_start[None, :, :]  # (B, N, 2)
+        t = np.clip(np.sum(rel_targets*seg_dir[None, :, :], axis=-1)/seg_sq_norm, 0.0, 1.0)  # (B, N)
+        proj = seg_start[None, :, :] + t[..., None]*seg_dir[None, :, :]  # (B, N, 2)
+        # Minimize in squared space: one sqrt per target instead of one per (target, segment) pair
+        distances_m[i0:i0+block] = np.sum(np.square(sub_xy[:, None, :] - proj), axis=-1).min(axis=1)  # (B,)
+    return np.sqrt(distances_m)  # (M,)
+
+
+def _cumulative_dist_3d_km(*, lon: np.ndarray, lat: np.ndarray, ele_m: np.ndarray,
+                           prev_cumul_dist_km: float) -> np.ndarray:
+    """Cumulative 3D distance kernel over all track segments, matching gpxpy's per-pair distance_3d.
+
+    Single vectorized pass over contiguous float64 buffers (see gpxpy.geo.distance for the reference
+    scalar implementation).
+    """
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+    seg_dist_m = np.hypot(dlat, dlon*np.cos(np.radians(lat[:-1])))*ONE_DEGREE
+    seg_dist_m = np.hypot(seg_dist_m, np.diff(ele_m))
+
+    far = (np.abs(dlat) > 0.2) | (np.abs(dlon) > 0.2)
+    if far.any():
+        # Like gpxpy, fall back to a 2D haversine distance between distant points
+        phi = np.radians(lat)
+        hav = np.sin(np.diff(phi)/2)**2 + np.cos(phi[:-1])*np.cos(phi[1:])*np.sin(np.radians(dlon)/2)**2
+        seg_dist_m = np.where(far, 2*EARTH_RADIUS*np.arcsin(np.sqrt(hav)), seg_dist_m)
+
+    return prev_cumul_dist_km + np.concatenate(([0.0], np.cumsum(seg_dist_m)*1e-3))
@@ -1,8 +1,10 @@
 #!/usr/bin/python3
 """Multi Gpx Track."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 
+import numpy as np
 from shapely.geometry import LineString
 
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
@@ -35,8 +37,9 @@ class MultiGpxTrack:
 
     @staticmethod
     def load(list_gpx_path: list[str] | list[bytes] | list[str | bytes]) -> 'MultiGpxTrack':
-        """Load multiple GPX files and return MultiGpxTrack."""
-        tracks = [GpxTrack.load(path) for path in list_gpx_path]
+        """Load multiple GPX files in parallel and return MultiGpxTrack."""
+        with ThreadPoolExecutor(max_workers=min(8, len(list_gpx_path))) as executor:
+            tracks = list(executor.map(GpxTrack.load, list_gpx_path))
 
         return MultiGpxTrack(tracks=tracks)
 
@@ -44,23 +47,17 @@ class MultiGpxTrack:
         """Merge multiple GpxTrack into one."""
         assert_not_empty(self.tracks)
 
-        list_cumul_d = self.tracks[0].list_cumul_dist_km
+        list_cumul_d = [self.tracks[0].list_cumul_dist_km]
         for gpx in self.tracks[1:]:
-            list_cumul_d.extend([cumul_d + list_cumul_d[-1] for cumul_d in gpx.list_cumul_dist_km])
+            list_cumul_d.append(gpx.list_cumul_dist_km + list_cumul_d[-1][-1])
 
         durations = [gpx.duration_s for gpx in self.tracks if gpx.duration_s is not None]
         total_duration = sum(durations) if len(durations) == len(self.tracks) else None
 
-        return GpxTrack(list_lon=[lon
-                                  for gpx in self.tracks
-                                  for lon in gpx.list_lon],
-                        list_lat=[lat
-                                  for gpx in self.tracks
-                                  for lat in gpx.list_lat],
-                        list_ele_m=[ele
-                                    for gpx in self.tracks
-                                    for ele in gpx.list_ele_m],
-                        list_cumul_dist_km=list_cumul_d,
+        return GpxTrack(list_lon=np.concatenate([gpx.list_lon for gpx in self.tracks]),
+                        list_lat=np.concatenate([gpx.list_lat for gpx in self.tracks]),
+                        list_ele_m=np.concatenate([gpx.list_ele_m for gpx in self.tracks]),
+                        list_cumul_dist_km=np.concatenate(list_cumul_d),
                         uphill_m=sum(gpx.uphill_m for gpx in self.tracks),
                         duration_s=total_duration)
 
@@ -2,6 +2,7 @@
 """Paper Size."""
 import math
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -12,7 +13,7 @@ class PaperSize:
     margin_mm: int
     name: str
 
-    @property
+    @cached_property
     def diag_mm(self) -> float:
         """Diagonal in mm."""
         return math.sqrt(self.w_mm**2 + self.h_mm**2)
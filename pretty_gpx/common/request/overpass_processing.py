@@ -1,11 +1,12 @@
 #!/usr/bin/python3
 """Overpass Processing."""
 from dataclasses import dataclass
-from typing import cast
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 
 import numpy as np
+import shapely
 from matplotlib.patches import Polygon
 from overpy import Relation
 from overpy import RelationNode
@@ -16,11 +17,11 @@ from overpy import Result
 from overpy import Way
 from shapely import LinearRing as ShapelyLinearRing
 from shapely import LineString
-from shapely import MultiPolygon as ShapelyMultiPolygon
 from shapely import Point as ShapelyPoint
 from shapely import Polygon as ShapelyPolygon
 from shapely.prepared import prep
 
+from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
 from pretty_gpx.common.gpx.gpx_distance import ListLonLat
 from pretty_gpx.common.request.osm_name import get_shortest_name
 from pretty_gpx.common.utils.logger import logger
@@ -39,6 +40,25 @@ class SurfacePolygons:
     exterior_polygons: list[Polygon]
     interior_polygons: list[Polygon]
 
+    def __getstate__(self) -> dict[str, list[np.ndarray]]:
+        """Pickle only the polygon vertices as float32 arrays.
+
+        Matplotlib artists are large and fragile across versions; the vertices are all that is needed
+        to rebuild them, and float32 is well below drawing precision.
+        """
+        return {"exterior_xy": [patch.get_xy().astype(np.float32, copy=False) for patch in self.exterior_polygons],
+                "interior_xy": [patch.get_xy().astype(np.float32, copy=False) for patch in self.interior_polygons]}
+
+    def __setstate__(self, state: dict[str, list[Any]]) -> None:
+        """Rebuild the Matplotlib polygons from the stored vertices."""
+        if "exterior_xy" in state:
+            self.exterior_polygons = [Polygon(xy) for xy in state["exterior_xy"]]
+            self.interior_polygons = [Polygon(xy) for xy in state["interior_xy"]]
+        else:
+            # Cache files written before the vertex-array format pickled the Matplotlib polygons directly
+            self.exterior_polygons = state["exterior_polygons"]
+            self.interior_polygons = state["interior_polygons"]
+
 
 T = TypeVar('T', bound=list[RelationWayGeometryValue] | ListLonLat)
 HashTable = dict[tuple[int, int], list[tuple[int, str]]]
@@ -63,8 +83,12 @@ class Segment(Generic[T]):
 
 
 def simplify_ways(coordinates: list[ListLonLat],
-                  tolerance_m: float = 5) -> list[ListLonLat]:
-    """Simplify a list of ways using Douglas-Peucker algorithm from shapely."""
+                  tolerance_m: float = 5) -> list[np.ndarray]:
+    """Simplify a list of ways using Douglas-Peucker algorithm from shapely.
+
+    Returns one float32 (N, 2) lon/lat array per way: the coordinates are only drawn afterwards, so a
+    compact contiguous buffer beats a list of boxed tuples.
+    """
     tolerance = np.rad2deg(tolerance_m/EARTH_RADIUS_M)
     total_hausdorff_distance = 0
     logger.debug("Merge ways")
@@ -73,7 +97,7 @@ def simplify_ways(coordinates: list[ListLonLat],
     for way in coordinates:
         line = LineString(way)
         simplified_line = line.simplify(tolerance)
-        simplified_ways.append(list(simplified_line.coords))
+        simplified_ways.append(np.asarray(simplified_line.coords, dtype=np.float32))
         if DEBUG_DISTANCE:
             total_hausdorff_distance += EARTH_RADIUS_M*np.deg2rad(line.hausdorff_distance(simplified_line))
     if DEBUG_DISTANCE:
@@ -82,15 +106,14 @@ def simplify_ways(coordinates: list[ListLonLat],
 
 
 @profile
-def get_ways_coordinates_from_results(api_result: Result) -> list[ListLonLat]:
+def get_ways_coordinates_from_results(api_result: Result) -> list[np.ndarray]:
     """Get the lat/lon nodes coordinates of the ways from the overpass API result."""
     ways_coords = []
     for way in api_result.ways:
         road = get_way_coordinates(way)
         if len(road) > 0:
             ways_coords.append(road)
-    ways_coords = simplify_ways(coordinates=ways_coords)
-    return ways_coords
+    return simplify_ways(coordinates=ways_coords)
 
 
 @profile
@@ -109,23 +132,39 @@ def get_rivers_polygons_from_lines(api_result: Result,
     for way in api_result.ways:
         if len(way.nodes) <= 2:
             continue
-        ways_coords.extend([[(float(node.lon), float(node.lat)) for node in way.nodes
-                             if node.lat is not None and node.lon is not None]])
-        new_polygons = []
-    for segment in ways_coords:
-        line = LineString(segment)
-        line = cast(LineString, line.simplify(0.5 * np.rad2deg(width / EARTH_RADIUS_M)))
-        # Transforms the line into a polygon with
-        # a buffer around the line with half the width
-        buffered = line.buffer(width/2.0)
-        if isinstance(buffered, ShapelyPolygon):
-            # TODO: Check that multipolygons are not useful and can be skiped
-            new_polygons.append(buffered)
-        elif isinstance(buffered, ShapelyMultiPolygon) and len(buffered) > 0:
-            for i in range(len(buffered)):
-                polygon = buffered[i]
-                new_polygons.append(polygon)
-    return new_polygons
+        ways_coords.append(np.array([(float(node.lon), float(node.lat)) for node in way.nodes
+                                     if node.lat is not None and node.lon is not None]))
+    if len(ways_coords) == 0:
+        return []
+
+    # Bulk-build the linestrings and run simplify/buffer element-wise inside GEOS, instead of one
+    # Python-level call per way
+    lines = shapely.linestrings(np.concatenate(ways_coords),
+                                indices=np.repeat(np.arange(len(ways_coords)),
+                                                  [len(coords) for coords in ways_coords]))
+    lines = shapely.simplify(lines, 0.5 * np.rad2deg(width / EARTH_RADIUS_M))
+    # Transforms each line into a polygon with a buffer around the line with half the width
+    # (quad_segs=16 is the Geometry.buffer default, the ufunc defaults to 8)
+    buffered = shapely.buffer(lines, width/2.0, quad_segs=16)
+    return [polygon for polygon in shapely.get_parts(buffered) if isinstance(polygon, ShapelyPolygon)]
+
+
+@profile
+def crop_polygons_to_bounds(polygons_l: list[ShapelyPolygon], bounds: GpxBounds) -> list[ShapelyPolygon]:
+    """Drop polygons outside the bounds and crop the others to it.
+
+    Overpass returns the full geometry of every relation touching the bbox, which can span areas far
+    outside the rendered canvas; cropping keeps those vertices out of the Matplotlib tessellator.
+    """
+    if len(polygons_l) == 0:
+        return []
+    bbox = shapely.box(bounds.lon_min, bounds.lat_min, bounds.lon_max, bounds.lat_max)
+    geoms = np.array(polygons_l, dtype=object)
+    keep_idx = np.sort(shapely.STRtree(geoms).query(bbox, predicate='intersects'))  # Keep the original order
+    cropped = shapely.intersection(geoms[keep_idx], bbox)
+    # Two get_parts passes flatten both multipolygons and the rare collections with degenerate members
+    return [polygon for polygon in shapely.get_parts(shapely.get_parts(cropped))
+            if isinstance(polygon, ShapelyPolygon) and not polygon.is_empty]
 
 
 @profile
@@ -188,6 +227,19 @@ def get_polygons_from_relation(relation: Relation) -> list[ShapelyPolygon]:
     return polygon_l
 
 
+@profile
+def get_relation_exterior_lonlat(relation: Relation) -> np.ndarray:
+    """Get the outer lon/lat vertices of a relation as a (K, 2) array, without intermediate Shapely polygons."""
+    outer_geometry_l, _ = get_members_from_relation(relation=relation, recursion_depth=0)
+    n_points = sum(len(segment) for segment in outer_geometry_l)
+    flat_lonlat = np.fromiter((coord
+                               for segment in outer_geometry_l
+                               for geom in segment
+                               for coord in (float(geom.lon), float(geom.lat))),
+                              dtype=np.float64, count=2*n_points)
+    return flat_lonlat.reshape(-1, 2)
+
+
 def is_a_closed_shape(geometry: list[RelationWayGeometryValue], eps: float = 1e-5) -> bool:
     """Check if a geometry is closed (e.g. last point = first point)."""
     lon_start, lon_end = float(geometry[0].lon), float(geometry[-1].lon)
@@ -525,18 +577,28 @@ def get_lat_lon_from_geometry(geom: list[RelationWayGeometryValue],
     return list(simplified_line.coords)
 
 
+def __rings_to_patches(rings: np.ndarray) -> list[Polygon]:
+    """Extract the coordinates of all rings in a single bulk call and split them into patches."""
+    if len(rings) == 0:
+        return []
+    coords, ring_idx = shapely.get_coordinates(rings, return_index=True)
+    splits = np.searchsorted(ring_idx, np.arange(1, len(rings)))
+    return [Polygon(xy) for xy in np.split(coords, splits)]
+
+
 @profile
 def create_patch_collection_from_polygons(polygons_l: list[ShapelyPolygon]) -> SurfacePolygons:
     """Create a patch list."""
-    patches_exterior: list[Polygon] = []
-    patches_interior: list[Polygon] = []
-    for geometry in polygons_l:
-
-        exterior_coords = np.asarray(geometry.exterior.coords)
-        patches_exterior.append(Polygon(exterior_coords))
-
-        interiors = [np.asarray(interior.coords) for interior in list(geometry.interiors)]
-        patches_interior.extend(Polygon(interior) for interior in interiors)
+    # Extract the ring vertices through vectorized GEOS calls, instead of accessing
+    # geometry.exterior.coords polygon by polygon from Python
+    polygons = np.asarray(polygons_l, dtype=object)
+    patches_exterior = __rings_to_patches(shapely.get_exterior_ring(polygons))
+
+    n_interiors = shapely.get_num_interior_rings(polygons)
+    interior_rings = shapely.get_interior_ring(np.repeat(polygons, n_interiors),
+                                               np.concatenate([np.arange(n) for n in n_interiors])
+                                               if len(polygons) > 0 else np.empty(0, dtype=int))
+    patches_interior = __rings_to_patches(interior_rings)
 
     surface = SurfacePolygons(exterior_polygons=patches_exterior,
                               interior_polygons=patches_interior)
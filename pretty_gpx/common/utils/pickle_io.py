@@ -1,13 +1,18 @@
 #!/usr/bin/python3
 """Pickle I/O."""
+import os
 import pickle
 from typing import Any
 
 
 def write_pickle(file_path: str, obj: Any) -> None:
     """Write object to pickle file."""
-    with open(file_path, 'wb') as f:
-        pickle.dump(obj, f)
+    # Write to a sibling temp file and atomically rename it, so a crash never leaves a truncated
+    # cache file behind. Protocol 5 serializes ndarray buffers without a per-buffer memcpy
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(obj, f, protocol=5)
+    os.replace(tmp_path, file_path)
 
 
 def read_pickle(file_path: str) -> Any:
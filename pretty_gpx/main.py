@@ -8,6 +8,7 @@ from pretty_gpx.common.utils.profile import Profiling
 from pretty_gpx.fly.fly_io_setup import fly_io_setup
 from pretty_gpx.ui.pages.page.header import create_rendering_pages
 from pretty_gpx.ui.pages.page.homepage import create_homepage
+from pretty_gpx.ui.utils.run import warm_up_process_pool
 
 fly_io_setup()
 
@@ -15,6 +16,7 @@ create_homepage()
 create_rendering_pages()
 
 
+app.on_startup(warm_up_process_pool)
 app.on_shutdown(lambda: Profiling.export_events())
 
 ui.run(title='Pretty GPX',
@@ -4,6 +4,7 @@ import os
 from dataclasses import dataclass
 
 import numpy as np
+import shapely
 from overpy import Relation
 from overpy import RelationWay
 from overpy import Way
@@ -168,11 +169,16 @@ class BridgeCrossingAnalyzer:
     @classmethod
     def analyze_track_bridge_crossing(cls, track: GpxTrack, bridges: list[Bridge]) -> list[Bridge]:
         """Returns bridges significantly crossed by the track."""
+        if len(bridges) == 0:
+            return []
+
         crossed_bridges = []
         shapely_track = LineString(zip(track.list_lon, track.list_lat))
 
-        for bridge in bridges:
-            intersection = shapely_track.intersection(bridge.polygon)
+        # Shapely 2.x broadcasts the intersection over an array of geometries, pushing the loop into GEOS
+        intersections = shapely.intersection(shapely_track, np.array([bridge.polygon for bridge in bridges]))
+
+        for bridge, intersection in zip(bridges, intersections):
             if intersection.is_empty:
                 continue
 
@@ -258,6 +264,7 @@ def process_city_bridges(query: OverpassQuery, track: GpxTrack) -> list[ScatterP
                   for b in crossed_bridges]
 
     logger.info(f"Found {len(result)} bridge(s)")
-    write_pickle(BRIDGES_CACHE.get_path(track), result)
-    query.add_cached_result(BRIDGES_CACHE.name, cache_file=BRIDGES_CACHE.get_path(track))
+    cache_pkl = BRIDGES_CACHE.get_path(track)
+    write_pickle(cache_pkl, result)
+    query.add_cached_result(BRIDGES_CACHE.name, cache_file=cache_pkl)
     return result
\ No newline at end of file
@@ -1,22 +1,21 @@
 #!/usr/bin/python3
 """City Points of Interest."""
+import functools
+import heapq
 import os
-import re
 from dataclasses import dataclass
 from dataclasses import field
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from pretty_gpx.common.drawing.utils.scatter_point import ScatterPoint
 from pretty_gpx.common.drawing.utils.scatter_point import ScatterPointCategory
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
 from pretty_gpx.common.gpx.gpx_distance import get_pairwise_distance_m
-from pretty_gpx.common.gpx.gpx_distance import ListLonLat
 from pretty_gpx.common.gpx.gpx_track import GpxTrack
 from pretty_gpx.common.request.gpx_data_cache_handler import GpxDataCacheHandler
 from pretty_gpx.common.request.osm_name import get_shortest_name
-from pretty_gpx.common.request.overpass_processing import get_polygons_from_relation
+from pretty_gpx.common.request.overpass_processing import get_relation_exterior_lonlat
 from pretty_gpx.common.request.overpass_processing import get_way_coordinates
 from pretty_gpx.common.request.overpass_request import OverpassQuery
 from pretty_gpx.common.utils.pickle_io import read_pickle
@@ -37,11 +36,11 @@ class CandidateCityPoi:
     category: ScatterPointCategory
     name: str
     importance: int
-    poly_lonlat: ListLonLat
+    poly_lonlat: np.ndarray  # (K, 2)
     center_lonlat: tuple[float, float] = field(init=False)  # Prevent initialization
 
     def __post_init__(self) -> None:
-        avg = np.mean(self.poly_lonlat, axis=0)
+        avg = self.poly_lonlat.mean(axis=0)
         self.center_lonlat = (float(avg[0]), float(avg[1]))
 
 
@@ -90,20 +89,22 @@ def process_city_pois(query: OverpassQuery, gpx_track: GpxTrack) -> list[Scatter
                     candidates.append(CandidateCityPoi(category=ScatterPointCategory.CITY_POI_DEFAULT,
                                                        name=safe(get_shortest_name(way)),
                                                        importance=importance,
-                                                       poly_lonlat=lon_lat))
+                                                       poly_lonlat=np.asarray(lon_lat)))
 
         res_relations = query.get_query_result(CITY_POINTS_OF_INTEREST_RELATIONS_ARRAY_NAME)
         for rel in res_relations.relations:
             importance = __get_importance_score(rel.tags)
             if importance is not None:
-                lon_lat = [(lon, lat)
-                           for poly in get_polygons_from_relation(rel)
-                           for lon, lat in zip(*poly.exterior.xy)]
-                if len(lon_lat) > 0:
+                rel_lonlat = get_relation_exterior_lonlat(rel)
+                if len(rel_lonlat) > 0:
                     candidates.append(CandidateCityPoi(category=ScatterPointCategory.CITY_POI_DEFAULT,
                                                        name=safe(get_shortest_name(rel)),
                                                        importance=importance,
-                                                       poly_lonlat=lon_lat))
+                                                       poly_lonlat=rel_lonlat))
+
+        # Pre-truncate by importance: the filters below never add candidates, so only the
+        # most important ones can survive __take_n_best
+        candidates = __take_n_best(candidates, 64)
 
         # Keep only the ones close to the GPX track
         candidates = __filter_close_gpx(candidates, gpx_track)
@@ -127,42 +128,45 @@ def process_city_pois(query: OverpassQuery, gpx_track: GpxTrack) -> list[Scatter
     return city_pois
 
 
-IMPORTANCE_BASIC_TAG_PATTERN = re.compile(
-    r"^(" + "|".join([
-        "heritage",
-        "source",
-        "contact",
-        "architect",
-        "opening_hours",
-        "historic",
-        "phone",
-        "email",
-        "website",
-        "importance",
-        "image",
-        "wikimedia_commons"
-    ]) + r")"
+# Prefix literals checked with str.startswith, which loops over the tuple in C without any regex engine
+IMPORTANCE_BASIC_TAG_PREFIXES = (
+    "heritage",
+    "source",
+    "contact",
+    "architect",
+    "opening_hours",
+    "historic",
+    "phone",
+    "email",
+    "website",
+    "importance",
+    "image",
+    "wikimedia_commons",
 )
 
 
-IMPORTANCE_NAME_TAG_PATTERN = re.compile(
-    r"^(" + "|".join([
-        "name:",
-        "alt_name",
-        "short_name",
-    ]) + r")"
+IMPORTANCE_NAME_TAG_PREFIXES = (
+    "name:",
+    "alt_name",
+    "short_name",
 )
 
 
-def __get_importance_score(tags: dict[str, str]) -> int | None:
-    """Returns an importance score based on specific tags and their occurrences."""
-    # Count occurrences of relevant tags
+@functools.lru_cache(maxsize=4096)
+def __count_importance_keys(keys: frozenset[str]) -> int:
+    """Count occurrences of relevant tag keys (many OSM elements share the same key set)."""
     count = 0
-    for key in tags:
-        if IMPORTANCE_BASIC_TAG_PATTERN.match(key):
+    for key in keys:
+        if key.startswith(IMPORTANCE_BASIC_TAG_PREFIXES):
             count += 1
-        elif IMPORTANCE_NAME_TAG_PATTERN.match(key):
+        elif key.startswith(IMPORTANCE_NAME_TAG_PREFIXES):
             count += 2
+    return count
+
+
+def __get_importance_score(tags: dict[str, str]) -> int | None:
+    """Returns an importance score based on specific tags and their occurrences."""
+    count = __count_importance_keys(frozenset(tags))
 
     if tags.get("building") == "cathedral":
         count += 5
@@ -178,51 +182,53 @@ def __get_importance_score(tags: dict[str, str]) -> int | None:
 
 def __filter_close_gpx(city_pois: list[CandidateCityPoi], gpx: GpxTrack) -> list[CandidateCityPoi]:
     """Filter the city pois that are close to the gpx track."""
-    filtered_city_pois: list[CandidateCityPoi] = []
+    if len(city_pois) == 0:
+        return []
 
-    for city_poi in city_pois:
-        min_distance = np.min(gpx.get_distances_m(targets_lon_lat=city_poi.poly_lonlat))
+    # Batch the polygon vertices of all the city pois into a single distance query
+    all_lonlat = np.concatenate([city_poi.poly_lonlat for city_poi in city_pois])
+    offsets = np.cumsum([0] + [len(city_poi.poly_lonlat) for city_poi in city_pois])
 
-        if city_poi.importance > 70:
-            ths_m = 800
-        elif city_poi.importance > 30:
-            ths_m = 500
-        else:
-            ths_m = 150
+    vertex_dist_m = gpx.get_distances_m(targets_lon_lat=all_lonlat, max_distance_m=800)
+    poi_dist_m = np.minimum.reduceat(vertex_dist_m, offsets[:-1])
 
-        if min_distance < ths_m:
-            filtered_city_pois.append(city_poi)
+    importances = np.array([city_poi.importance for city_poi in city_pois])
+    ths_m = np.where(importances > 70, 800, np.where(importances > 30, 500, 150))
 
-    return filtered_city_pois
+    return [city_poi for city_poi, keep_it in zip(city_pois, poi_dist_m < ths_m) if keep_it]
 
 
 def __nms_city_pois(city_pois: list[CandidateCityPoi], bounds: GpxBounds) -> list[CandidateCityPoi]:
     """Apply a Non-Maximum Suppression on the city pois."""
-    if len(city_pois) == 0:
-        return []
+    if len(city_pois) <= 1:
+        return city_pois  # Nothing to suppress
 
     ths = 0.02 * bounds.diagonal_m
 
     city_pois = sorted(city_pois, key=lambda x: x.importance, reverse=True)
 
     dist_matrix = get_pairwise_distance_m(lonlat_1=np.array([poi.center_lonlat for poi in city_pois]))
+    close = dist_matrix < ths
     keep = np.zeros(len(city_pois), dtype=bool)
+    suppressed = np.zeros(len(city_pois), dtype=bool)
     for i in range(len(city_pois)):
-        if i != 0 and np.min(dist_matrix[i][keep]) < ths:
+        if suppressed[i]:
             continue
 
         keep[i] = True
+        suppressed |= close[i]  # Greedy: drop every poi too close to a kept one
 
     return [city_poi for city_poi, keep_it in zip(city_pois, keep) if keep_it]
 
 
 def __take_n_best(city_pois: list[CandidateCityPoi], n: int) -> list[CandidateCityPoi]:
     """Take the n best city pois."""
-    city_pois = sorted(city_pois, key=lambda x: x.importance, reverse=True)
-    return city_pois[:n]
+    # Equivalent to sorted(..., reverse=True)[:n] but O(M log n)
+    return heapq.nlargest(n, city_pois, key=lambda x: x.importance)
 
 
 def __debug(city_pois: list[CandidateCityPoi] | list[ScatterPoint], gpx: GpxTrack) -> None:
+    import matplotlib.pyplot as plt  # Only imported on the debug path, to keep module import light
     plt.figure()
     gpx.plot()
 
@@ -1,12 +1,15 @@
 #!/usr/bin/python3
 """Rivers."""
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
 from pretty_gpx.common.request.gpx_data_cache_handler import GpxDataCacheHandler
 from pretty_gpx.common.request.overpass_processing import create_patch_collection_from_polygons
+from pretty_gpx.common.request.overpass_processing import crop_polygons_to_bounds
 from pretty_gpx.common.request.overpass_processing import get_polygons_from_closed_ways
 from pretty_gpx.common.request.overpass_processing import get_polygons_from_relations
 from pretty_gpx.common.request.overpass_processing import get_rivers_polygons_from_lines
@@ -28,10 +31,15 @@ RIVERS_LINE_WAYS_ARRAY_NAME = "rivers_line_ways"
 RIVER_LINE_WIDTH_M = 8
 RIVER_LINE_WIDTH = np.rad2deg(RIVER_LINE_WIDTH_M/EARTH_RADIUS_M)
 
+# Precomputed alternation of the water types to keep, used in the Overpass regex filters
+NATURAL_WATER_REGEX = "|".join(["reservoir", "canal", "stream_pool", "lagoon", "oxbow", "river", "lake", "pond"])
+
 
 @profile
 def prepare_download_city_rivers(query: OverpassQuery, bounds: GpxBounds) -> None:
     """Add the queries for city rivers inside the global OverpassQuery."""
+    # Snap the bounds to a coarse grid, so that small pans/zooms around the same area hit the cache
+    bounds = bounds.snap_to_grid()
     cache_pkl = RIVERS_CACHE.get_path(bounds)
 
     if os.path.isfile(cache_pkl):
@@ -39,11 +47,9 @@ def prepare_download_city_rivers(query: OverpassQuery, bounds: GpxBounds) -> Non
         return
 
     min_len = bounds.diagonal_m*0.01
-    natural_water_l = ["reservoir", "canal", "stream_pool", "lagoon", "oxbow", "river", "lake", "pond"]
-    join_character = '|'
     query.add_overpass_query(array_name=RIVERS_RELATIONS_ARRAY_NAME,
                              query_elements=['relation["natural"="water"]'
-                                             f'["water"~"({join_character.join(natural_water_l)})"]',
+                                             f'["water"~"({NATURAL_WATER_REGEX})"]',
                                              'relation["natural"="wetland"]["wetland" = "tidal"]',
                                              'relation["natural"="bay"]'],
                              bounds=bounds,
@@ -52,7 +58,7 @@ def prepare_download_city_rivers(query: OverpassQuery, bounds: GpxBounds) -> Non
                              return_geometry=True)
     query.add_overpass_query(array_name=RIVERS_WAYS_ARRAY_NAME,
                              query_elements=['way["natural"="water"]["water"~'
-                                             f'"({join_character.join(natural_water_l)})"]',
+                                             f'"({NATURAL_WATER_REGEX})"]',
                                              f'way["natural"="water"][!"water"](if: length() > {min_len})',
                                              'way["natural"="wetland"]["wetland" = "tidal"]',
                                              'way["natural"="bay"]'],
@@ -67,27 +73,43 @@ def prepare_download_city_rivers(query: OverpassQuery, bounds: GpxBounds) -> Non
                              return_geometry=False)
 
 
+@functools.lru_cache(maxsize=8)
+def __read_rivers_cache(cache_file: str, mtime_ns: int) -> SurfacePolygons:
+    """Read the rivers cache file, memoized on (path, mtime) to skip unpickling on repeated UI updates."""
+    return read_pickle(cache_file)
+
+
 @profile
 def process_city_rivers(query: OverpassQuery,
                         bounds: GpxBounds) -> SurfacePolygons:
     """Process the overpass API result to get the rivers of a city."""
+    # Use the same snapped bounds as prepare_download_city_rivers, so the cache keys match
+    bounds = bounds.snap_to_grid()
     if query.is_cached(RIVERS_CACHE.name):
         cache_file = query.get_cache_file(RIVERS_CACHE.name)
-        return read_pickle(cache_file)
+        return __read_rivers_cache(cache_file, os.stat(cache_file).st_mtime_ns)
 
     with Profiling.Scope("Process Rivers"):
         rivers_relation_results = query.get_query_result(RIVERS_RELATIONS_ARRAY_NAME)
         rivers_way_results = query.get_query_result(RIVERS_WAYS_ARRAY_NAME)
         rivers_line_results = query.get_query_result(RIVERS_LINE_WAYS_ARRAY_NAME)
-        rivers_relations = get_polygons_from_relations(results=rivers_relation_results)
-        rivers_ways = get_polygons_from_closed_ways(rivers_way_results.ways)
-        rivers = rivers_relations + rivers_ways
-        rivers_lines_polygons = get_rivers_polygons_from_lines(api_result=rivers_line_results,
-                                                               width=RIVER_LINE_WIDTH)
-        rivers = rivers_lines_polygons + rivers
+
+        # The three polygon-assembly stages are independent and the Shapely operations release
+        # the GIL, so run them in a small thread pool
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_relations = executor.submit(get_polygons_from_relations, results=rivers_relation_results)
+            future_ways = executor.submit(get_polygons_from_closed_ways, rivers_way_results.ways)
+            future_lines = executor.submit(get_rivers_polygons_from_lines,
+                                           api_result=rivers_line_results,
+                                           width=RIVER_LINE_WIDTH)
+            rivers_relations = future_relations.result()
+            rivers_ways = future_ways.result()
+            rivers_lines_polygons = future_lines.result()
+        rivers = rivers_lines_polygons + rivers_relations + rivers_ways
         logger.info(f"Found {len(rivers_relations)} polygons for rivers "
                     f"with relations and {len(rivers_ways)} with ways and"
                     f" {len(rivers_lines_polygons)} created with river main line")
+        rivers = crop_polygons_to_bounds(rivers, bounds)
         rivers_patches = create_patch_collection_from_polygons(rivers)
 
     cache_pkl = RIVERS_CACHE.get_path(bounds)
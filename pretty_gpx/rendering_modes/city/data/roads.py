@@ -1,13 +1,13 @@
 #!/usr/bin/python3
 """Roads."""
+import functools
 import os
 from enum import auto
 from enum import Enum
 
-from tqdm import tqdm
+import numpy as np
 
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
-from pretty_gpx.common.gpx.gpx_distance import ListLonLat
 from pretty_gpx.common.request.gpx_data_cache_handler import GpxDataCacheHandler
 from pretty_gpx.common.request.overpass_processing import get_ways_coordinates_from_results
 from pretty_gpx.common.request.overpass_request import OverpassQuery
@@ -44,7 +44,14 @@ QUERY_NAME_PER_CITY_ROAD_TYPE = {
 
 assert HIGHWAY_TAGS_PER_CITY_ROAD_TYPE.keys() == QUERY_NAME_PER_CITY_ROAD_TYPE.keys()
 
-CityRoads = dict[CityRoadType, list[ListLonLat]]
+# Precompute the Overpass query element of each road type once at import,
+# since prepare_download_city_roads is called on every background update
+QUERY_ELEMENTS_PER_CITY_ROAD_TYPE = {
+    city_road_type: [f"way['highway'~'({'|'.join(highway_tags)})']"]
+    for city_road_type, highway_tags in HIGHWAY_TAGS_PER_CITY_ROAD_TYPE.items()
+}
+
+CityRoads = dict[CityRoadType, list[np.ndarray]]
 
 
 @profile
@@ -59,28 +66,38 @@ def prepare_download_city_roads(query: OverpassQuery,
     Returns:
         List of roads (sequence of lon, lat coordinates) for each road type
     """
+    # Snap the bounds to a coarse grid, so that small pans/zooms around the same area hit the cache
+    bounds = bounds.snap_to_grid()
     cache_pkl = ROADS_CACHE.get_path(bounds)
 
     if os.path.isfile(cache_pkl):
         query.add_cached_result(ROADS_CACHE.name, cache_file=cache_pkl)
         return
 
-    for city_road_type in tqdm(CityRoadType):
-        highway_tags_str = "|".join(HIGHWAY_TAGS_PER_CITY_ROAD_TYPE[city_road_type])
+    logger.debug(f"Queuing {len(CityRoadType)} road queries: {[t.name for t in CityRoadType]}")
+    for city_road_type in CityRoadType:
         query.add_overpass_query(QUERY_NAME_PER_CITY_ROAD_TYPE[city_road_type],
-                                 [f"way['highway'~'({highway_tags_str})']"],
+                                 QUERY_ELEMENTS_PER_CITY_ROAD_TYPE[city_road_type],
                                  bounds,
                                  include_way_nodes=True,
                                  add_relative_margin=None)
 
 
+@functools.lru_cache(maxsize=8)
+def __read_roads_cache(cache_file: str, mtime_ns: int) -> CityRoads:
+    """Read the roads cache file, memoized on (path, mtime) to skip unpickling on repeated UI updates."""
+    return read_pickle(cache_file)
+
+
 @profile
 def process_city_roads(query: OverpassQuery,
-                       bounds: GpxBounds) -> dict[CityRoadType, list[ListLonLat]]:
+                       bounds: GpxBounds) -> dict[CityRoadType, list[np.ndarray]]:
     """Query the overpass API to get the roads of a city."""
+    # Use the same snapped bounds as prepare_download_city_roads, so the cache keys match
+    bounds = bounds.snap_to_grid()
     if query.is_cached(ROADS_CACHE.name):
         cache_file = query.get_cache_file(ROADS_CACHE.name)
-        return read_pickle(cache_file)
+        return __read_roads_cache(cache_file, os.stat(cache_file).st_mtime_ns)
 
     with Profiling.Scope("Process City Roads"):
         roads = dict()
@@ -1,12 +1,14 @@
 #!/usr/bin/python3
 """Drawing Component for a City Background."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Protocol
 
+import numpy as np
+
 from pretty_gpx.common.drawing.utils.drawing_figure import DrawingFigure
 from pretty_gpx.common.drawing.utils.drawing_figure import MetersFloat
 from pretty_gpx.common.gpx.gpx_bounds import GpxBounds
-from pretty_gpx.common.gpx.gpx_distance import ListLonLat
 from pretty_gpx.common.layout.paper_size import PaperSize
 from pretty_gpx.common.request.overpass_processing import SurfacePolygons
 from pretty_gpx.common.request.overpass_request import OverpassQuery
@@ -38,12 +40,12 @@ class CityBackground:
     """Drawing Component for a City Background."""
     union_bounds: GpxBounds
 
-    full_roads: dict[CityRoadType, list[ListLonLat]]
+    full_roads: dict[CityRoadType, list[np.ndarray]]
     full_rivers: SurfacePolygons
     full_forests: SurfacePolygons
     full_farmlands: SurfacePolygons
 
-    paper_roads: dict[CityRoadType, list[ListLonLat]] | None
+    paper_roads: dict[CityRoadType, list[np.ndarray]] | None
     paper_rivers: SurfacePolygons | None
     paper_forests: SurfacePolygons | None
     paper_farmlands: SurfacePolygons | None
@@ -60,10 +62,15 @@ class CityBackground:
 
         total_query.launch_queries()
 
-        # Retrieve the data
-        roads = process_city_roads(total_query, union_bounds)
-        rivers = process_city_rivers(total_query, union_bounds)
-        forests, farmlands = process_city_forests(total_query, union_bounds)
+        # Retrieve the data. The three stages are independent, so overlap their I/O (cache reads,
+        # JSON decoding) in a small thread pool
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_roads = executor.submit(process_city_roads, total_query, union_bounds)
+            future_rivers = executor.submit(process_city_rivers, total_query, union_bounds)
+            future_forests = executor.submit(process_city_forests, total_query, union_bounds)
+            roads = future_roads.result()
+            rivers = future_rivers.result()
+            forests, farmlands = future_forests.result()
         forests.interior_polygons = []
 
         return CityBackground(union_bounds=union_bounds,
@@ -68,7 +68,11 @@ class CityDrawer(DrawerSingleTrack):
         scatter_points += process_city_pois(total_query, gpx_track)
         # TODO(upgrade): Draw the POIs as well. This is currently disabled because text allocation fails when there
         # are too many overlapping scatter points. Need to filter out the points that are too close to each other.
-        background = CityBackground.from_union_bounds(layouts.union_bounds)
+        if self.data is not None and self.data.layouts.union_bounds == layouts.union_bounds:
+            # The background only depends on the union bounds: skip the Overpass round-trip
+            background = self.data.background
+        else:
+            background = CityBackground.from_union_bounds(layouts.union_bounds)
 
         layout = layouts.layouts[paper]
         background.change_papersize(paper, layout.background_bounds)
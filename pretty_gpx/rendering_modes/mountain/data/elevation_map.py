@@ -13,6 +13,7 @@ from pretty_gpx.common.utils.asserts import assert_close
 from pretty_gpx.common.utils.logger import logger
 from pretty_gpx.common.utils.profile import profile
 from pretty_gpx.common.utils.profile import Profiling
+from pretty_gpx.common.utils.utils import are_close
 
 ELEVATION_CACHE = GpxDataCacheHandler(name='elevation', extension='.tif')
 
@@ -42,12 +43,17 @@ def download_elevation_map(bounds: GpxBounds) -> np.ndarray:
     # Handle NaNs
     elevation[np.isnan(elevation)] = 0.0
 
-    return elevation
+    # Hillshading is memory-bound and DEM precision is ~1m: float32 halves the bandwidth of every
+    # downstream pass without visible loss
+    return elevation.astype(np.float32, copy=False)
 
 
 @profile
 def rescale_elevation(elevation: np.ndarray, scale: float) -> np.ndarray:
     """Upscale/Downscale elevation map."""
+    if are_close(scale, 1.0, eps=1e-6):
+        return elevation  # Nothing to resample
+
     new_h = int(scale*elevation.shape[0])
     new_w = int(scale*elevation.shape[1])
     new_elevation = cv2.resize(elevation, (new_w, new_h),
@@ -77,7 +77,8 @@ def process_mountain_passes(query: OverpassQuery, gpx_track: GpxTrack) -> list[S
         passes: list[ScatterPoint] = []
         if len(candidates) != 0:
             # Keep only the ones close to the GPX track
-            distances_m = gpx_track.get_distances_m(targets_lon_lat=[(pt.lon, pt.lat) for pt in candidates])
+            distances_m = gpx_track.get_distances_m(targets_lon_lat=[(pt.lon, pt.lat) for pt in candidates],
+                                                    max_distance_m=50)
             candidates = [pt for pt, d_m in zip(candidates, distances_m) if d_m < 50]
 
             if len(candidates) != 0:
@@ -38,6 +38,14 @@ class MountainBackground:
     low_res_elevation: CachedHillShading | None
     high_res_elevation: CachedHillShading | None
 
+    # Cache of the last colored hillshade, keyed by the inputs it depends on
+    last_draw_key: tuple[bool, int, bool, str] | None = None
+    last_colored_hillshade: np.ndarray | None = None
+
+    # Reused buffers for the colored-hillshade kernel, to avoid reallocating H*W*3 images on every recompute
+    hillshade_float_buf: np.ndarray | None = None
+    hillshade_rgb_buf: np.ndarray | None = None
+
     @staticmethod
     @profile
     def from_union_bounds(union_bounds: GpxBounds) -> 'MountainBackground':
@@ -68,18 +76,37 @@ class MountainBackground:
         current_dpi = elevation_map.shape[0] / mm_to_inch(paper.h_mm-2*paper.margin_mm)
         self.low_res_elevation = CachedHillShading(rescale_elevation(elevation_map, MOUNTAIN_LOW_RES_DPI/current_dpi))
         self.high_res_elevation = CachedHillShading(rescale_elevation(elevation_map, HIGH_RES_DPI/current_dpi))
+        self.last_draw_key = None
+        self.last_colored_hillshade = None
 
     @profile
     def draw(self, fig: DrawingFigure, params: MountainBackgroundParamsProtocol, high_resolution: bool) -> None:
         """Draw the shaded elevation map."""
-        if high_resolution:
-            elevation_shading = self.high_res_elevation
-        else:
-            elevation_shading = self.low_res_elevation
-        grey_hillshade = safe(elevation_shading).render_grey(params.mountain_azimuth)[..., None]
-        background_color_rgb = hex_to_rgb(params.mountain_background_color)
-        color_0 = (0, 0, 0) if params.mountain_dark_mode else background_color_rgb
-        color_1 = background_color_rgb if params.mountain_dark_mode else (255, 255, 255)
-        colored_hillshade = grey_hillshade * (np.array(color_1) - np.array(color_0)) + np.array(color_0)
-
-        fig.imshow(img=colored_hillshade.astype(np.uint8))
+        # The colored hillshade only depends on these inputs. Skip the full-image recomputation when the
+        # poster is redrawn with an unchanged background (e.g. on title/stats update)
+        draw_key = (high_resolution, params.mountain_azimuth, params.mountain_dark_mode,
+                    params.mountain_background_color)
+        if self.last_colored_hillshade is None or self.last_draw_key != draw_key:
+            if high_resolution:
+                elevation_shading = self.high_res_elevation
+            else:
+                elevation_shading = self.low_res_elevation
+            grey_hillshade = safe(elevation_shading).render_grey(params.mountain_azimuth)[..., None]
+            background_color_rgb = hex_to_rgb(params.mountain_background_color)
+            color_0 = (0, 0, 0) if params.mountain_dark_mode else background_color_rgb
+            color_1 = background_color_rgb if params.mountain_dark_mode else (255, 255, 255)
+
+            # Fused float32 multiply-add into reused buffers: colored = grey*(color_1-color_0) + color_0
+            shape = grey_hillshade.shape[:2] + (3,)
+            if self.hillshade_float_buf is None or self.hillshade_float_buf.shape != shape:
+                self.hillshade_float_buf = np.empty(shape, dtype=np.float32)
+                self.hillshade_rgb_buf = np.empty(shape, dtype=np.uint8)
+            delta = np.asarray(color_1, dtype=np.float32) - np.asarray(color_0, dtype=np.float32)
+            np.multiply(grey_hillshade, delta, out=self.hillshade_float_buf)
+            self.hillshade_float_buf += np.asarray(color_0, dtype=np.float32)
+            np.copyto(safe(self.hillshade_rgb_buf), self.hillshade_float_buf, casting='unsafe')
+
+            self.last_colored_hillshade = self.hillshade_rgb_buf
+            self.last_draw_key = draw_key
+
+        fig.imshow(img=safe(self.last_colored_hillshade))
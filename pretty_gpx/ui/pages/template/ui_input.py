@@ -3,18 +3,27 @@
 from collections.abc import Awaitable
 from collections.abc import Callable
 from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import cast
 from typing import Self
 
 from nicegui import ui
 
-from pretty_gpx.common.utils.utils import safe
+_UNSET: Any = object()
 
 
-@dataclass
+@dataclass(slots=True)
 class UiInput:
     """NiceGUI Input Wrapper."""
     input: ui.input
 
+    _cached_raw: Any = field(default=_UNSET, init=False, repr=False)
+    _cached_value: str | float | int | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        assert self.input is not None  # Checked once, so the hot value properties can skip the guard
+
     @classmethod
     def create(cls,
                *,
@@ -30,41 +39,44 @@ class UiInput:
     @property
     def _value_str(self) -> str | None:
         """Return the str value."""
-        val = str(safe(self.input.value))
-        return val if val != "" else None
+        val = self.input.value
+        return str(val) if val not in (None, "") else None
+
+    def _parse_value(self, parse: Callable[[str], str | float | int]) -> str | float | int | None:
+        """Parse the input value, re-parsing only when the underlying raw value has changed."""
+        raw = self.input.value
+        if raw is not self._cached_raw:
+            val = self._value_str
+            self._cached_value = parse(val) if val is not None else None
+            self._cached_raw = raw
+        return self._cached_value
 
 
-@dataclass
+@dataclass(slots=True)
 class UiInputStr(UiInput):
     """NiceGUI Str Input Wrapper."""
 
     @property
     def value(self) -> str | None:
         """Return the value."""
-        return self._value_str
+        return cast(str | None, self._parse_value(str))
 
 
-@dataclass
+@dataclass(slots=True)
 class UiInputFloat(UiInput):
     """NiceGUI Float Input Wrapper."""
 
     @property
     def value(self) -> float | None:
         """Return the value."""
-        val = self._value_str
-        if val is None:
-            return None
-        return float(val)
+        return cast(float | None, self._parse_value(float))
 
 
-@dataclass
+@dataclass(slots=True)
 class UiInputInt(UiInput):
     """NiceGUI Int Input Wrapper."""
 
     @property
     def value(self) -> int | None:
         """Return the value."""
-        val = self._value_str
-        if val is None:
-            return None
-        return int(float(val))
+        return cast(int | None, self._parse_value(lambda val: int(float(val))))
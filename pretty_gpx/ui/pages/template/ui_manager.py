@@ -1,18 +1,27 @@
 #!/usr/bin/python3
 """UI Manager."""
+import asyncio
+import contextlib
+import os
+import pickle
+import re
+import shutil
+import tempfile
 from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import BinaryIO
 from typing import cast
 from typing import Generic
 from typing import Literal
 from typing import TypeVar
 
-from natsort import index_natsorted
+from natsort import natsort_keygen
+from nicegui import Client
+from nicegui import context
 from nicegui import events
 from nicegui import ui
 from nicegui.elements.upload import Upload
-from pathvalidate import sanitize_filename
 
 from pretty_gpx.common.drawing.utils.color_theme import DarkTheme
 from pretty_gpx.common.drawing.utils.color_theme import LightTheme
@@ -33,6 +42,27 @@ from pretty_gpx.ui.utils.style import LIGHT_MODE_TEXT
 
 T = TypeVar('T', bound=DrawerSingleTrack | DrawerMultiTrack)
 
+NATSORT_KEY = natsort_keygen()  # Built once, natsort_keygen is not free
+
+_TITLE_CLEAN = re.compile(r'[\s\\/:*?"<>|\x00-\x1f]+')  # Whitespace and filename-invalid characters
+
+
+def _unlink_quietly(path: str) -> None:
+    """Remove a temporary file, ignoring the error if it is already gone."""
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _spool_upload(content: BinaryIO) -> str:
+    """Write an uploaded file to a temporary file and return its path.
+
+    Passing paths to the worker process is much cheaper than pickling the raw bytes across the
+    process boundary, and the worker reads the files straight from the OS disk cache.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".gpx", delete=False) as f:
+        shutil.copyfileobj(content, f)
+        return f.name
+
 
 @profile_parallel
 def _self_change_gpx_multi(drawer: T, b: list[bytes] | list[str], paper: PaperSize) -> T:
@@ -128,6 +158,9 @@ class UiManager(Generic[T], ABC):
 
     hidden: bool
 
+    _update_task: asyncio.Task | None
+    _last_preview_key: bytes | None
+
     ##########################
     # Abstract Methods
 
@@ -215,37 +248,47 @@ class UiManager(Generic[T], ABC):
         #######
 
         self.hidden = True
+        self._update_task = None
+        self._last_preview_key = None
 
     ##########################
     # Single/Multi Upload Events
 
     async def on_multi_upload_events(self, e: events.MultiUploadEventArguments) -> None:
         """Sort the uploaded files by name and process them."""
-        sorted_indices = index_natsorted(e.names)
-        names = [e.names[i] for i in sorted_indices]
-        contents = [e.contents[i].read() for i in sorted_indices]
+        pairs = sorted(zip(e.names, e.contents), key=lambda pair: NATSORT_KEY(pair[0]))
+        names = [name for name, _ in pairs]
+        paths = [_spool_upload(content) for _, content in pairs]
         assert isinstance(e.sender, Upload)
         e.sender.reset()
 
-        if len(contents) == 1:
-            res = None
-            ui.notify('Please upload at least two GPX files', type='negative')
-        else:
-            name = f'a {len(names)}-days track ({", ".join(names)})'
-            res = await run_cpu_bound(f"Download Data for {name}", _self_change_gpx_multi, self.drawer, contents,
-                                      self.paper_size.value)
+        try:
+            if len(paths) == 1:
+                res = None
+                ui.notify('Please upload at least two GPX files', type='negative')
+            else:
+                preview = ", ".join(names[:3]) + ("…" if len(names) > 3 else "")
+                name = f'a {len(names)}-days track ({preview})'
+                res = await run_cpu_bound(f"Download Data for {name}", _self_change_gpx_multi, self.drawer, paths,
+                                          self.paper_size.value)
+        finally:
+            for path in paths:
+                os.unlink(path)
 
         await self.update_drawer_if_sucessful(res)
 
     async def on_single_upload_events(self, e: events.UploadEventArguments) -> None:
         """Process the uploaded file."""
         name = e.name
-        content = e.content.read()
+        path = _spool_upload(e.content)
         assert isinstance(e.sender, Upload)
         e.sender.reset()
 
-        res = await run_cpu_bound(f"Download Data for {name}", _self_change_gpx_single,  self.drawer, content,
-                                  self.paper_size.value)
+        try:
+            res = await run_cpu_bound(f"Download Data for {name}", _self_change_gpx_single,  self.drawer, path,
+                                      self.paper_size.value)
+        finally:
+            os.unlink(path)
         await self.update_drawer_if_sucessful(res)
 
     async def update_drawer_if_sucessful(self, new_drawer: T | None) -> None:
@@ -253,6 +296,7 @@ class UiManager(Generic[T], ABC):
         if new_drawer is None:
             return
         self.drawer = new_drawer
+        self._last_preview_key = None  # New GPX data, force a redraw even if the parameters are unchanged
         await self.on_click_update()
         if self.hidden:
             self.make_visible()
@@ -291,9 +335,36 @@ class UiManager(Generic[T], ABC):
     # Drawing
 
     async def on_click_update(self) -> None:
-        """Asynchronously update the UiPlot."""
-        self.update_drawer_params()
-        await self.plot.update_preview(self.drawer.draw)
+        """Asynchronously update the UiPlot, debouncing rapid successive requests.
+
+        Scrubbing a slider or quickly toggling themes fires many updates. Each new request
+        cancels the previous one if it's still pending, and the actual redraw only starts
+        after a short quiet period, so only the latest parameters trigger a redraw.
+        """
+        if self._update_task is not None and not self._update_task.done():
+            self._update_task.cancel()
+        # NiceGUI keys slot stacks by asyncio task, so the new task starts with an empty one:
+        # capture the client here and re-enter it inside the task before touching any UI
+        client = context.client
+        self._update_task = asyncio.create_task(self._debounced_update(client))
+        try:
+            await self._update_task
+        except asyncio.CancelledError:
+            pass  # Superseded by a newer update
+
+    async def _debounced_update(self, client: Client) -> None:
+        """Wait for a short quiet period, then update the drawer parameters and the UiPlot."""
+        await asyncio.sleep(0.15)
+        with client:
+            self.update_drawer_params()
+
+            # Skip the redraw if nothing visible changed, e.g. Enter pressed in an unedited input
+            preview_key = pickle.dumps((self.paper_size.value.name, self.drawer.params))
+            if preview_key == self._last_preview_key:
+                return
+
+            await self.plot.update_preview(self.drawer.draw)
+            self._last_preview_key = preview_key  # Only once drawn, so a cancelled draw is retried
 
     async def on_click_download_svg(self) -> None:
         """Asynchronously render the high resolution poster and download it as SVG."""
@@ -311,6 +382,16 @@ class UiManager(Generic[T], ABC):
         basename = "poster"
         title = self.title.value
         if title:
-            basename += f"_{sanitize_filename(title.replace(' ', '_'))}"
-        ui.download(data, f'{basename}.{ext}')
+            clean_title = _TITLE_CLEAN.sub('_', title).strip('_')
+            if clean_title:
+                basename += f"_{clean_title}"
+
+        # Serve the poster from disk so NiceGUI streams it to the browser, instead of keeping the
+        # full payload in memory for the duration of the transfer (high-dpi SVGs reach tens of MB)
+        with tempfile.NamedTemporaryFile(suffix=f".{ext}", delete=False) as f:
+            f.write(data)
+        ui.download(f.name, f'{basename}.{ext}')
+
+        # Leave the browser a minute to fetch the file before removing it
+        asyncio.get_running_loop().call_later(60., _unlink_quietly, f.name)
         logger.info(f"{ext.upper()} Poster Downloaded")
@@ -99,8 +99,7 @@ def fig_to_rasterized_base64(fig: Figure, dpi: int) -> str:
     """Convert a Matplotlib figure to a rasterized PNG in base64."""
     buf = BytesIO()
     fig.savefig(buf, format='png', dpi=dpi)
-    buf.seek(0)
-    res = base64.b64encode(buf.read()).decode('utf-8')
+    res = base64.b64encode(buf.getbuffer()).decode('utf-8')  # memoryview, no copy of the PNG payload
     buf.close()
     plt.close(fig)
     return res
@@ -15,7 +15,7 @@ T = TypeVar('T')
 U = TypeVar('U')
 
 
-@dataclass
+@dataclass(slots=True)
 class UiToggle(Generic[T]):
     """NiceGUI Toggle Wrapper."""
     toggle: ui.toggle
@@ -18,6 +18,23 @@ P = ParamSpec('P')
 R = TypeVar('R')
 
 
+def _warm_up_worker() -> None:
+    """Preload the heavy scientific stack inside a pool worker."""
+    import matplotlib.pyplot  # noqa: F401
+    import shapely  # noqa: F401
+
+
+def warm_up_process_pool(n_workers: int = 2) -> None:
+    """Spawn workers of the shared NiceGUI process pool ahead of time.
+
+    run.cpu_bound reuses a persistent ProcessPoolExecutor, but its workers are only spawned (and
+    matplotlib/numpy only imported) on first use. Warming them at startup moves that cold-start
+    cost off the first poster rendering.
+    """
+    for _ in range(n_workers):
+        run.process_pool.submit(_warm_up_worker)
+
+
 async def run_cpu_bound_safe(msg: str, func: Callable[P, tuple[R, list[ProfilingEvent]]],
                              *args: P.args, **kwargs: P.kwargs) -> R:
     """Run a CPU-bound function (decorated with @profile_parallel) in a separate process."""